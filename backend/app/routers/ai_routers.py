@@ -2,10 +2,12 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from app.services.ai_service import AIService
 from app.services.excel_interpreter import ExcelInterpreter
+from app.services.prefetch_service import PrefetchService
 
 router = APIRouter()
 ai_service = AIService()
 excel_interpreter = ExcelInterpreter()
+prefetch_service = PrefetchService()
 
 class QueryRequest(BaseModel):
     query: str
@@ -17,12 +19,19 @@ class QueryResponse(BaseModel):
     explanation: str
     office_js_code: str
 
+class PrefetchRequest(BaseModel):
+    context: dict  # Excel context for the current selection
+
+class PrefetchResponse(BaseModel):
+    profile: dict
+    suggestions: dict
+
 @router.post("/query", response_model=QueryResponse)
 async def process_query(request: QueryRequest):
     try:
         ai_response = await ai_service.interpret_query(
             request.query, 
-            request.context
+            prefetch_service.warm_context(request.context)
         )
 
         excel_action = excel_interpreter.generate_action(ai_response)
@@ -31,6 +40,14 @@ async def process_query(request: QueryRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/prefetch", response_model=PrefetchResponse)
+async def prefetch(request: PrefetchRequest):
+    """Profile the current selection ahead of a query"""
+    try:
+        return prefetch_service.prefetch(request.context)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/create-chart")
 async def create_chart(request: QueryRequest):
     """Generate chart configuration"""
@@ -38,7 +55,7 @@ async def create_chart(request: QueryRequest):
         # Get chart config from AI
         chart_config = await ai_service.generate_chart(
             request.query,
-            request.context
+            prefetch_service.warm_context(request.context)
         )
         
         # Wrap it in the proper response format
@@ -61,7 +78,7 @@ async def generate_formula(request: QueryRequest):
     try:
         formula = await ai_service.generate_formula(
             request.query,
-            request.context
+            prefetch_service.warm_context(request.context)
         )
         return {"formula": formula}
     except Exception as e:
@@ -73,7 +90,7 @@ async def create_pivot_table(request: QueryRequest):
     try:
         pivot_config = await ai_service.generate_pivot_table(
             request.query,
-            request.context
+            prefetch_service.warm_context(request.context)
         )
         return pivot_config
     except Exception as e:
@@ -32,8 +32,17 @@ class AIService:
             print(f"Response text: {text}")
             raise ValueError(f"Failed to parse JSON response: {e}")
         
+    def _column_types(self, context: dict) -> tuple:
+        """Split headers into numeric and category columns using the selection profile"""
+        columns = context.get('profile', {}).get('columns', [])
+        numeric_columns = [c.get('header', '') for c in columns if c.get('numeric')]
+        category_columns = [c.get('header', '') for c in columns if c.get('header') and not c.get('numeric')]
+        return numeric_columns, category_columns
+        
     async def interpret_query(self, query: str, context: dict) -> dict:
         """Interpret user query and determine Excel action"""
+        
+        numeric_columns, category_columns = self._column_types(context)
                 
         user_message = f"""
             Query: {query}
@@ -43,6 +52,8 @@ class AIService:
             - Sheet Name: {context.get('sheetName', 'Unknown')}
             - Data Sample: {context.get('dataSample', [])}
             - Column Headers: {context.get('headers', [])}
+            - Numeric Columns: {numeric_columns}
+            - Category Columns: {category_columns}
 
             If the user doesn't specify where to put the formula, use the first empty cell after the selected range or data.
             """
@@ -111,6 +122,7 @@ class AIService:
         data_sample = context.get('dataSample', [])
         row_count = context.get('rowCount', 10)
         column_count = context.get('columnCount', 2)
+        numeric_columns, category_columns = self._column_types(context)
         
         # Build a smart suggestion for data range
         if selected_range and selected_range != 'None':
@@ -124,6 +136,8 @@ class AIService:
 
             Excel Context:
             - Available Columns: {headers}
+            - Numeric Columns: {numeric_columns}
+            - Category Columns: {category_columns}
             - Selected/Suggested Data Range: {suggested_range}
             - Number of Rows: {row_count}
             - Number of Columns: {column_count}
@@ -166,18 +180,8 @@ class AIService:
         headers = context.get('headers', [])
         data_sample = context.get('dataSample', [])
         
-        # Analyze data types to suggest numeric columns
-        numeric_columns = []
-        if data_sample and len(data_sample) > 1:
-            for col_idx, header in enumerate(headers):
-                try:
-                    # Check if most values in this column are numeric
-                    sample_values = [row[col_idx] for row in data_sample[1:] if len(row) > col_idx]
-                    numeric_count = sum(1 for v in sample_values if isinstance(v, (int, float)) or (isinstance(v, str) and v.replace('.','').replace('-','').isdigit()))
-                    if numeric_count > len(sample_values) / 2:
-                        numeric_columns.append(header)
-                except:
-                    pass
+        # Numeric columns are good candidates for values
+        numeric_columns, _ = self._column_types(context)
         
         user_message = f"""
     Create a pivot table for: {query}
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# Excel worksheet limits
+MAX_ROWS = 1048576
+MAX_COLUMNS = 16384
+
+
+class PrefetchService:
+    """Profile the user's selection ahead of a query and keep the result warm"""
+
+    def __init__(self, max_entries: int = 32, ttl_seconds: float = 120.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # cache key -> (expires_at, state), oldest first
+        self._cache = OrderedDict()
+
+    def _cache_key(self, context: dict) -> str:
+        """Fingerprint the parts of the context that the profile depends on"""
+        payload = json.dumps(
+            {
+                "sheetName": context.get('sheetName'),
+                "selectedRange": context.get('selectedRange'),
+                "usedRange": context.get('usedRange'),
+                "rowCount": context.get('rowCount'),
+                "columnCount": context.get('columnCount'),
+                "headers": context.get('headers', []),
+                "dataSample": context.get('dataSample', []),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get(self, context: dict) -> Optional[dict]:
+        """Return the cached state for this context, or None if cold/expired"""
+        key = self._cache_key(context)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, state = entry
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return state
+
+    def _store(self, key: str, state: dict):
+        self._cache[key] = (time.monotonic() + self.ttl_seconds, state)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def prefetch(self, context: dict) -> dict:
+        """Return the derived state for a selection, building and caching it on a miss"""
+        state = self.get(context)
+        if state is None:
+            profile = self._profile(context)
+            state = {"profile": profile, "suggestions": self._suggestions(profile)}
+            self._store(self._cache_key(context), state)
+        return state
+
+    def warm_context(self, context: dict) -> dict:
+        """Attach the selection profile to a query context.
+
+        Cache hits and misses yield the same profile, so prompts built from it
+        do not depend on whether the selection was prefetched. Any client-sent
+        "profile" is replaced.
+        """
+        return {**context, "profile": self.prefetch(context)["profile"]}
+
+    def _profile(self, context: dict) -> dict:
+        """Derive column types and range geometry from the selection"""
+        headers = [str(h).strip() for h in context.get('headers', [])]
+        data_sample = context.get('dataSample', [])
+        selected_range = context.get('selectedRange') or 'A1'
+
+        start_col, start_row, _, end_row = self._parse_range(selected_range)
+        used_range = context.get('usedRange')
+        used_end_row = self._parse_range(used_range)[3] if used_range else None
+
+        # Keyed by position: header names can repeat or be blank
+        columns = []
+        for col_idx, header in enumerate(headers):
+            if start_col + col_idx >= MAX_COLUMNS:
+                break
+            sample_values = [row[col_idx] for row in data_sample[1:] if len(row) > col_idx]
+            numeric_count = sum(1 for v in sample_values if self._is_numeric(v))
+            columns.append({
+                "index": col_idx,
+                "header": header,
+                "letter": self._column_letter(start_col + col_idx),
+                "numeric": bool(sample_values) and numeric_count > len(sample_values) / 2,
+            })
+
+        return {
+            "sheetName": context.get('sheetName', 'Unknown'),
+            "dataRange": selected_range,
+            "columns": columns,
+            "firstDataRow": start_row + 1,
+            "lastDataRow": end_row,
+            # Last row holding data on the sheet; None if the taskpane didn't say
+            "usedLastRow": used_end_row,
+        }
+
+    def _suggestions(self, profile: dict) -> dict:
+        """Precompute the cheap, likely follow-ups: totals, a chart and a pivot"""
+        columns = profile["columns"]
+        first_row = profile["firstDataRow"]
+        last_row = profile["lastDataRow"]
+
+        numeric = [c for c in columns if c["numeric"]]
+        # Charts and pivots refer to fields by name, so they need a header
+        named_numeric = [c for c in numeric if c["header"]]
+        named_category = [c for c in columns if c["header"] and not c["numeric"]]
+
+        totals = []
+        # Only when the selection ends at the sheet's last data row, so the
+        # row below it is empty and a total won't overwrite anything
+        if first_row <= last_row == profile["usedLastRow"] and last_row < MAX_ROWS:
+            for column in numeric:
+                col = column["letter"]
+                totals.append({
+                    "header": column["header"] or col,
+                    "formula": f"=SUM({col}{first_row}:{col}{last_row})",
+                    "targetCell": f"{col}{last_row + 1}",
+                })
+
+        chart = None
+        if named_numeric:
+            chart = {
+                "chartType": "column" if named_category else "line",
+                "dataRange": profile["dataRange"],
+                "title": (
+                    f"{named_numeric[0]['header']} by {named_category[0]['header']}"
+                    if named_category else named_numeric[0]["header"]
+                ),
+            }
+
+        pivot = None
+        if named_category:
+            pivot = {
+                "rows": [named_category[0]["header"]],
+                "columns": [],
+                "values": [
+                    {"field": named_numeric[0]["header"], "function": "sum"}
+                    if named_numeric
+                    else {"field": named_category[0]["header"], "function": "count"}
+                ],
+                "filters": [],
+            }
+
+        return {"totals": totals, "chart": chart, "pivot_table": pivot}
+
+    @staticmethod
+    def _is_numeric(value) -> bool:
+        if isinstance(value, bool):
+            return False
+        if isinstance(value, (int, float)):
+            return True
+        if not isinstance(value, str):
+            return False
+        try:
+            return math.isfinite(float(value))
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _parse_range(address: str):
+        """Split an A1 address into (start_col, start_row, end_col, end_row).
+
+        Columns are 0-based, rows 1-based. Whole-column ("A:B") and whole-row
+        ("2:5") references extend to the sheet limits.
+        """
+        def to_index(letters: str) -> int:
+            index = 0
+            for ch in letters.upper():
+                index = index * 26 + (ord(ch) - 64)
+            return index - 1
+
+        parts = address.replace('$', '').split(':')
+        cells = [re.fullmatch(r"([A-Za-z]*)(\d*)", part.strip()) for part in parts[:2]]
+        if not all(cells) or not any(cell.group(0) for cell in cells):
+            return 0, 1, 0, 1
+
+        start, end = cells[0], cells[-1]
+        start_col = to_index(start.group(1)) if start.group(1) else 0
+        end_col = to_index(end.group(1)) if end.group(1) else MAX_COLUMNS - 1
+        start_row = int(start.group(2)) if start.group(2) else 1
+        end_row = int(end.group(2)) if end.group(2) else MAX_ROWS
+
+        return (
+            min(start_col, MAX_COLUMNS - 1),
+            min(start_row, MAX_ROWS),
+            min(end_col, MAX_COLUMNS - 1),
+            min(end_row, MAX_ROWS),
+        )
+
+    @staticmethod
+    def _column_letter(index: int) -> str:
+        letters = ""
+        index += 1
+        while index > 0:
+            index, remainder = divmod(index - 1, 26)
+            letters = chr(65 + remainder) + letters
+        return letters
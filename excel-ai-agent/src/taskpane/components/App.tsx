@@ -1,8 +1,12 @@
 import * as React from "react";
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import axios from "axios";
 
 const API_BASE_URL = "http://localhost:8000/api/v1";
+const PREFETCH_DEBOUNCE_MS = 500;
+// Upper bounds on what is read from the sheet; the backend only uses a sample
+const SAMPLE_ROWS = 10;
+const MAX_SAMPLE_COLUMNS = 200;
 
 interface AIResponse {
   action: string;
@@ -11,6 +15,22 @@ interface AIResponse {
   office_js_code: string;
 }
 
+const quickActionStyle: React.CSSProperties = {
+  padding: "6px 10px",
+  backgroundColor: "#fff",
+  color: "#0078d4",
+  border: "1px solid #0078d4",
+  cursor: "pointer",
+  fontSize: "13px",
+  borderRadius: "4px"
+};
+
+interface PrefetchSuggestions {
+  totals: { header: string; formula: string; targetCell: string }[];
+  chart: any | null;
+  pivot_table: any | null;
+}
+
 const App: React.FC = () => {
   const [query, setQuery] = useState("");
   const [loading, setLoading] = useState(false);
@@ -18,6 +38,13 @@ const App: React.FC = () => {
   const [error, setError] = useState("");
   const [successMessage, setSuccessMessage] = useState("");
   const [editedTargetCell, setEditedTargetCell] = useState("");
+  const [suggestions, setSuggestions] = useState<PrefetchSuggestions | null>(null);
+  // Bumped on every selection or data change; a prefetched context is only
+  // reused while its version is still current
+  const contextVersion = useRef(0);
+  const prefetchedContext = useRef<{ version: number; context: any } | null>(null);
+  const prefetchTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
+  const prefetchAbort = useRef<AbortController | null>(null);
 
   // Auto-clear messages after 5 seconds
   useEffect(() => {
@@ -46,23 +73,38 @@ const App: React.FC = () => {
   const getExcelContext = async () => {
     return await Excel.run(async (context) => {
       const sheet = context.workbook.worksheets.getActiveWorksheet();
-      const range = context.workbook.getSelectedRange();
+      const selection = context.workbook.getSelectedRange();
+      
+      // Clip whole-column/row and select-all selections to the data on the sheet
+      const usedRange = sheet.getUsedRange();
+      const clipped = selection.getIntersectionOrNullObject(usedRange);
       
       sheet.load("name");
-      range.load("address, values, rowCount, columnCount");
+      usedRange.load("address");
+      selection.load("address, rowCount, columnCount");
+      clipped.load("address, rowCount, columnCount");
       
       await context.sync();
       
-      // Get headers (first row) - ensure they're strings
-      const headers = range.values[0].map(h => String(h || '').trim());
+      const range = clipped.isNullObject ? selection : clipped;
       
-      // Get all data including headers
-      const allData = range.values;
+      // Only read the sampled rows, never the values of the whole selection
+      const sample = range.getCell(0, 0).getResizedRange(
+        Math.min(range.rowCount, SAMPLE_ROWS) - 1,
+        Math.min(range.columnCount, MAX_SAMPLE_COLUMNS) - 1
+      );
+      sample.load("values");
+      
+      await context.sync();
+      
+      // Get headers (first row) - ensure they're strings
+      const headers = sample.values[0].map(h => String(h || '').trim());
       
       return {
         sheetName: sheet.name,
         selectedRange: range.address.split("!")[1] || range.address, // Remove sheet name if present
-        dataSample: allData.slice(0, 10), // First 10 rows including header
+        usedRange: usedRange.address.split("!")[1] || usedRange.address,
+        dataSample: sample.values, // First rows including header
         headers: headers,
         rowCount: range.rowCount,
         columnCount: range.columnCount
@@ -70,6 +112,77 @@ const App: React.FC = () => {
     });
   };
 
+  const prefetchSelection = async () => {
+    const version = contextVersion.current;
+    const controller = new AbortController();
+    prefetchAbort.current = controller;
+
+    try {
+      const context = await getExcelContext();
+      if (version !== contextVersion.current) return;
+      
+      // The next query reuses this instead of re-reading the sheet
+      prefetchedContext.current = { version, context };
+      
+      const result = await axios.post(`${API_BASE_URL}/prefetch`, {
+        context: context
+      }, { signal: controller.signal });
+      
+      if (version === contextVersion.current) {
+        setSuggestions(result.data.suggestions);
+      }
+    } catch (err: any) {
+      // Prefetching is best-effort; the query path works without it
+      if (!axios.isCancel(err)) {
+        console.warn("Prefetch failed:", err);
+      }
+    }
+  };
+
+  // Drop state for the old selection right away, then prefetch once it settles
+  const invalidateContext = () => {
+    contextVersion.current += 1;
+    prefetchedContext.current = null;
+    prefetchAbort.current?.abort();
+    setSuggestions(null);
+    
+    if (prefetchTimer.current) clearTimeout(prefetchTimer.current);
+    prefetchTimer.current = setTimeout(prefetchSelection, PREFETCH_DEBOUNCE_MS);
+  };
+
+  // Warm backend state while the user is still choosing a selection
+  useEffect(() => {
+    const handlers: OfficeExtension.EventHandlerResult<any>[] = [];
+
+    Excel.run(async (context) => {
+      handlers.push(context.workbook.onSelectionChanged.add(async () => invalidateContext()));
+      // Edits don't move the selection but do make the prefetched values stale
+      handlers.push(context.workbook.worksheets.onChanged.add(async () => invalidateContext()));
+      await context.sync();
+    }).catch((err) => console.warn("Could not register selection handlers:", err));
+
+    // Cover the selection that was already active when the pane opened
+    invalidateContext();
+
+    return () => {
+      if (prefetchTimer.current) clearTimeout(prefetchTimer.current);
+      prefetchAbort.current?.abort();
+      for (const handler of handlers) {
+        Excel.run(handler.context, async (context) => {
+          handler.remove();
+          await context.sync();
+        }).catch(() => {});
+      }
+    };
+  }, []);
+
+  // Show a precomputed suggestion as a response, skipping the AI round trip
+  const applySuggestion = (action: string, parameters: any, explanation: string) => {
+    setError("");
+    setSuccessMessage("");
+    setResponse({ action, parameters, explanation, office_js_code: "" });
+  };
+
   const handleQuery = async () => {
     if (!query.trim()) return;
     
@@ -79,7 +192,11 @@ const App: React.FC = () => {
     setSuccessMessage("");
 
     try {
-      const context = await getExcelContext();
+      // Reuse the prefetched context if nothing changed since it was read
+      const prefetched = prefetchedContext.current;
+      const context = prefetched && prefetched.version === contextVersion.current
+        ? prefetched.context
+        : await getExcelContext();
       
       // First, interpret the query
       const interpretResult = await axios.post(`${API_BASE_URL}/query`, {
@@ -373,6 +490,49 @@ const App: React.FC = () => {
         {loading ? "Processing..." : "Ask AI"}
       </button>
 
+      {suggestions && !loading && (
+        <div style={{ marginTop: "15px" }}>
+          <small style={{ color: "#666", fontSize: "12px" }}>
+            Quick actions for this selection
+          </small>
+          <div style={{ display: "flex", flexWrap: "wrap", gap: "6px", marginTop: "6px" }}>
+            {suggestions.totals.slice(0, 3).map((total) => (
+              <button
+                key={total.targetCell}
+                onClick={() => applySuggestion(
+                  "formula",
+                  { formula: total.formula, targetCell: total.targetCell },
+                  `Sum of ${total.header}`
+                )}
+                style={quickActionStyle}
+              >
+                Sum {total.header}
+              </button>
+            ))}
+            {suggestions.chart && (
+              <button
+                onClick={() => applySuggestion("chart", suggestions.chart, `Creating a ${suggestions.chart.chartType} chart`)}
+                style={quickActionStyle}
+              >
+                Chart
+              </button>
+            )}
+            {suggestions.pivot_table && (
+              <button
+                onClick={() => applySuggestion(
+                  "pivot_table",
+                  suggestions.pivot_table,
+                  `Pivot table by ${suggestions.pivot_table.rows[0]}`
+                )}
+                style={quickActionStyle}
+              >
+                Pivot table
+              </button>
+            )}
+          </div>
+        </div>
+      )}
+
       {response && (
         <div style={{ 
           marginTop: "20px", 